@@ -1,12 +1,26 @@
-__all__ = ["Article", "amap"]
+__all__ = ["Article", "amap", "amap_async", "amap_iter"]
 
 
 # standard library
-from asyncio import Semaphore, TimeoutError, gather, run, wait_for
-from collections.abc import Awaitable, Callable, Iterable
+from asyncio import (
+    FIRST_COMPLETED,
+    Future,
+    Semaphore,
+    TimeoutError,
+    ensure_future,
+    gather,
+    run,
+    wait,
+    wait_for,
+)
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from dataclasses import dataclass, field, replace
-from logging import getLogger
+from functools import lru_cache, partial
+from itertools import islice
+from logging import DEBUG, getLogger
+from operator import attrgetter
 from reprlib import Repr
+from sys import intern
 from typing import Optional, TypeVar, Union
 
 
@@ -23,6 +37,7 @@ Finally = Union[TArticle, Awaitable[TArticle]]
 
 # constants
 LOGGER = getLogger(__name__)
+NAME_GETTER = attrgetter("name")
 
 
 @dataclass(frozen=True)
@@ -41,7 +56,7 @@ class Article:
     title: str
     """Title of the article."""
 
-    authors: list[str]
+    authors: tuple[str, ...]
     """Authors of the article."""
 
     summary: str
@@ -59,7 +74,7 @@ class Article:
 
         return cls(
             title=result.title,
-            authors=[author.name for author in result.authors],
+            authors=tuple(map(intern, map(NAME_GETTER, result.authors))),
             summary=result.summary,
             url=result.entry_id,
         )
@@ -69,9 +84,15 @@ class Article:
         if not format_spec:
             return super().__format__(format_spec)
         else:
-            repr = Repr()
-            repr.maxother = int(format_spec)
-            return repr.repr(self)
+            return get_repr(int(format_spec)).repr(self)
+
+
+@lru_cache(maxsize=None)
+def get_repr(maxother: int, /) -> Repr:
+    """Return a (cached) shortened representation formatter."""
+    repr = Repr()
+    repr.maxother = maxother
+    return repr
 
 
 def amap(
@@ -84,6 +105,9 @@ def amap(
 ) -> list[TArticle]:
     """Article-to-article map function.
 
+    This is a synchronous wrapper of ``amap_async``.
+    Use ``await amap_async(...)`` instead inside a running event loop.
+
     Args:
         func: Function or coroutine function for mapping.
         articles: Articles to be mapped.
@@ -98,30 +122,138 @@ def amap(
         If timeout occurs, the original article is returned.
 
     """
+    return run(
+        amap_async(
+            func,
+            articles,
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+    )
 
-    async def afunc(article: TArticle, /) -> TArticle:
-        if isinstance(result := func(article), Awaitable):
-            return replace(await result, origin=article)
-        else:
-            return replace(result, origin=article)
-
-    async def main() -> list[TArticle]:
-        sem = Semaphore(concurrency)
-
-        async def runner(article: TArticle, /) -> TArticle:
-            async with sem:
-                try:
-                    LOGGER.debug(f"Start processing {article:100}.")
-                    return await wait_for(afunc(article), timeout)
-                except TimeoutError:
-                    LOGGER.warning(
-                        f"Timeout in processing {article:100}."
-                        "The original article was returned instead."
-                    )
-                    return article
-                finally:
-                    LOGGER.debug(f"Finish processing {article:100}.")
-
-        return list(await gather(*map(runner, articles)))
-
-    return run(main())
+
+async def amap_async(
+    func: Callable[[TArticle], Finally[TArticle]],
+    articles: Iterable[TArticle],
+    /,
+    *,
+    concurrency: int = CONCURRENCY,
+    timeout: float = TIMEOUT,
+) -> list[TArticle]:
+    """Article-to-article map function (async version).
+
+    Args:
+        func: Function or coroutine function for mapping.
+        articles: Articles to be mapped.
+        concurrency: Number of concurrent executions.
+            Only used when ``func`` is a coroutine function.
+        timeout: Timeout per article in seconds.
+            Only used when ``func`` is a coroutine function.
+
+    Returns:
+        List of mapped articles by ``func`` with each
+        original article stored in the ``origin`` attribute.
+        If timeout occurs, the original article is returned.
+
+    """
+    sem = Semaphore(concurrency)
+    runner = partial(_runner, func=func, sem=sem, timeout=timeout)
+    return list(await gather(*map(runner, articles)))
+
+
+async def amap_iter(
+    func: Callable[[TArticle], Finally[TArticle]],
+    articles: Iterable[TArticle],
+    /,
+    *,
+    concurrency: int = CONCURRENCY,
+    timeout: float = TIMEOUT,
+) -> AsyncIterator[TArticle]:
+    """Article-to-article map function (async iterator version).
+
+    Unlike ``amap_async``, articles are consumed lazily so that
+    at most ``concurrency`` of them are in flight at a time,
+    and mapped articles are yielded in order of completion.
+
+    Args:
+        func: Function or coroutine function for mapping.
+        articles: Articles to be mapped.
+        concurrency: Number of concurrent executions.
+            Only used when ``func`` is a coroutine function.
+        timeout: Timeout per article in seconds.
+            Only used when ``func`` is a coroutine function.
+
+    Yields:
+        Mapped articles by ``func`` with each
+        original article stored in the ``origin`` attribute.
+        If timeout occurs, the original article is yielded.
+
+    """
+    iterator = iter(articles)
+    pending: set[Future[TArticle]] = set()
+    process = partial(_process, func=func, timeout=timeout)
+
+    try:
+        while True:
+            for article in islice(iterator, concurrency - len(pending)):
+                pending.add(ensure_future(process(article)))
+
+            if not pending:
+                return
+
+            done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def _apply(
+    func: Callable[[TArticle], Finally[TArticle]],
+    article: TArticle,
+    /,
+) -> TArticle:
+    """Apply a function or coroutine function to an article."""
+    if isinstance(result := func(article), Awaitable):
+        return replace(await result, origin=article)
+    else:
+        return replace(result, origin=article)
+
+
+async def _process(
+    article: TArticle,
+    /,
+    *,
+    func: Callable[[TArticle], Finally[TArticle]],
+    timeout: float,
+) -> TArticle:
+    """Map an article by a function or coroutine function."""
+    try:
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(f"Start processing {article:100}.")
+
+        return await wait_for(_apply(func, article), timeout)
+    except TimeoutError:
+        LOGGER.warning(
+            f"Timeout in processing {article:100}."
+            "The original article was returned instead."
+        )
+        return article
+    finally:
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(f"Finish processing {article:100}.")
+
+
+async def _runner(
+    article: TArticle,
+    /,
+    *,
+    func: Callable[[TArticle], Finally[TArticle]],
+    sem: Semaphore,
+    timeout: float,
+) -> TArticle:
+    """Map an article within the limit of concurrent executions."""
+    async with sem:
+        return await _process(article, func=func, timeout=timeout)
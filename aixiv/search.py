@@ -1,19 +1,28 @@
-__all__ = ["format", "search"]
+__all__ = ["format", "format_async", "search", "search_async"]
 
 
 # standard library
+from asyncio import Queue, ensure_future, gather, run, to_thread
 from collections.abc import Iterable, Sequence
 from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import islice
 from logging import getLogger
+from os import environ
+from pathlib import Path
+from pickle import dumps, loads
 from re import compile
-from typing import Literal
+from tempfile import NamedTemporaryFile
+from threading import local
+from typing import Literal, Optional
 
 
 # dependencies
-from arxiv import Client, Search, SortCriterion, SortOrder
-from dateparser import parse
+from arxiv import Client, Result, Search, SortCriterion, SortOrder
 from pylatexenc.latex2text import LatexNodes2Text
-from .article import Article, TArticle, amap
+from .article import Article, TArticle
 from .defaults import (
     KEYWORDS,
     CATEGORIES,
@@ -27,10 +36,18 @@ from .defaults import (
 
 
 # constants
+ARXIV_CACHE_DELAY = timedelta(days=3)
+ARXIV_CACHE_ENV = "AIXIV_CACHE_DIR"
+ARXIV_CACHE_SUFFIX = ".pickle"
+ARXIV_CHUNK_SIZE = 50
 ARXIV_DATE_FORMAT = "%Y%m%d%H%M%S"
-ARXIV_LATEX_CONVERTER = LatexNodes2Text()
-ARXIV_SEP_PATTERN = compile(r"\n+\s*|\n*\s+")
+ARXIV_ISODATE_PATTERN = compile(r"\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}(?::\d{2})?)?")
+ARXIV_LATEX_LOCAL = local()
+ARXIV_LATEX_PATTERN = compile(r"[\\$%&#^_{}~]|--|``|''|[!?]`")
+ARXIV_PAGE_SIZE = 10 * ARXIV_CHUNK_SIZE
+ARXIV_QUEUE_SIZE = ARXIV_PAGE_SIZE // ARXIV_CHUNK_SIZE
 ARXIV_SEP_REPL = " "
+ARXIV_UTC_SUFFIX = " in UTC"
 LOGGER = getLogger(__name__)
 
 
@@ -41,7 +58,8 @@ def format(articles: Iterable[TArticle], /) -> list[TArticle]:
         articles: Articles to be formatted.
 
     Returns:
-        Articles with each title and summary formatted.
+        Articles with each title and summary formatted
+        and each original article stored in the ``origin`` attribute.
 
     """
 
@@ -49,15 +67,32 @@ def format(articles: Iterable[TArticle], /) -> list[TArticle]:
         try:
             title = convert_latex(format_sep(article.title))
             summary = convert_latex(format_sep(article.summary))
-            return replace(article, title=title, summary=summary)
+            return replace(article, title=title, summary=summary, origin=article)
         except Exception:
             LOGGER.warning(
                 f"Failed to format {article:100}. "
                 "The original article was returned instead."
             )
-            return article
+            return replace(article, origin=article)
 
-    return list(amap(runner, articles))
+    return list(map(runner, articles))
+
+
+async def format_async(articles: Iterable[TArticle], /) -> list[TArticle]:
+    """Format the title and summary of each article (async version).
+
+    Articles are formatted serially in a worker thread
+    so that it does not block the running event loop.
+
+    Args:
+        articles: Articles to be formatted.
+
+    Returns:
+        Articles with each title and summary formatted
+        and each original article stored in the ``origin`` attribute.
+
+    """
+    return await to_thread(format, articles)
 
 
 def search(
@@ -70,9 +105,18 @@ def search(
     maximum: int = MAXIMUM,
     order: Literal["ascending", "descending"] = ORDER,
     sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    client: Optional[Client] = None,
 ) -> list[Article]:
     """Search for articles in arXiv.
 
+    This is a synchronous wrapper of ``search_async``.
+    If the environment variable ``AIXIV_CACHE_DIR`` is set,
+    non-empty results of a search whose end date is more than
+    three days ago are cached there per query and returned
+    without accessing arXiv from the next search onward.
+    More recent searches (e.g. the default one) are never cached
+    as arXiv may still add articles to their date range.
+
     Args:
         categories: arXiv categories.
         keywords: Keywords of the search.
@@ -80,24 +124,102 @@ def search(
         end: End date (and time) of the search.
         formatting: Whether to format articles.
         maximum: Maximum number of articles to return.
+            If it is zero, all articles found will be returned.
         order: Sort order of the search results.
         sort: Sort criterion of the search results.
+        client: arXiv API client to be used. If not given, a client
+            with a page size of up to 500 articles will be created.
+            Reusing a client across searches keeps its delay
+            between requests.
 
     Returns:
         Articles found with given conditions.
 
     """
-    query = f"submittedDate:[{format_date(start)} TO {format_date(end)}]"
+    return run(
+        search_async(
+            categories,
+            keywords,
+            start,
+            end,
+            formatting=formatting,
+            maximum=maximum,
+            order=order,
+            sort=sort,
+            client=client,
+        )
+    )
+
+
+async def search_async(
+    categories: Sequence[str] = CATEGORIES,
+    keywords: Sequence[str] = KEYWORDS,
+    start: str = START,
+    end: str = END,
+    *,
+    formatting: bool = FORMATTING,
+    maximum: int = MAXIMUM,
+    order: Literal["ascending", "descending"] = ORDER,
+    sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    client: Optional[Client] = None,
+) -> list[Article]:
+    """Search for articles in arXiv (async version).
+
+    Query results are fetched page by page in a worker thread
+    and the chunks of each page are formatted while the next page
+    is being fetched (only if more than one page is needed).
+    See ``search`` for the caching of the search results.
+
+    Args:
+        categories: arXiv categories.
+        keywords: Keywords of the search.
+        start: Start date (and time) of the search.
+        end: End date (and time) of the search.
+        formatting: Whether to format articles.
+        maximum: Maximum number of articles to return.
+            If it is zero, all articles found will be returned.
+        order: Sort order of the search results.
+        sort: Sort criterion of the search results.
+        client: arXiv API client to be used. If not given, a client
+            with a page size of up to 500 articles will be created.
+            Reusing a client across searches keeps its delay
+            between requests.
+
+    Returns:
+        Articles found with given conditions.
+
+    """
+    start_date, end_date = format_date(start), format_date(end)
+    parts = [f"submittedDate:[{start_date} TO {end_date}]"]
 
     if categories:
         sub = " OR ".join(f"cat:{cat}" for cat in categories)
-        query += f" AND ({sub})"
+        parts.append(f"({sub})")
 
     if keywords:
         sub = " OR ".join(f'abs:"{kwd}"' for kwd in keywords)
-        query += f" AND ({sub})"
+        parts.append(f"({sub})")
+
+    query = " AND ".join(parts)
+
+    if is_settled(end_date):
+        cache = get_cache(query, formatting, maximum, order, sort)
+    else:
+        cache = None
+
+    if cache is not None:
+        if (cached := await to_thread(load_cache, cache)) is not None:
+            return cached
+
+    if client is None:
+        # maximum of zero means no limit for arXiv
+        page_size = min(maximum, ARXIV_PAGE_SIZE) if maximum > 0 else ARXIV_PAGE_SIZE
+        client = Client(
+            page_size=page_size,
+            delay_seconds=5,
+            num_retries=5,
+        )
 
-    client = Client(delay_seconds=5, num_retries=5)
     search = Search(
         query,
         sort_by=SortCriterion(sort),
@@ -105,26 +227,143 @@ def search(
         max_results=maximum,
     )
     results = client.results(search)
-    articles = list(map(Article.from_arxiv, results))
+    queue: Queue[Optional[list[Result]]] = Queue(ARXIV_QUEUE_SIZE)
+
+    async def producer() -> None:
+        while chunk := await to_thread(list, islice(results, ARXIV_CHUNK_SIZE)):
+            await queue.put(chunk)
+
+        await queue.put(None)
+
+    async def consumer() -> list[Article]:
+        articles: list[Article] = []
+
+        while (chunk := await queue.get()) is not None:
+            found = list(map(Article.from_arxiv, chunk))
+            articles.extend(await format_async(found) if formatting else found)
+
+        return articles
+
+    producing = ensure_future(producer())
+    consuming = ensure_future(consumer())
+
+    try:
+        _, articles = await gather(producing, consuming)
+    finally:
+        # stop the other task if either of them fails
+        producing.cancel()
+        consuming.cancel()
+
     LOGGER.debug(f"Query for search: {query!r}")
     LOGGER.debug(f"Number of articles found: {len(articles)}")
 
-    return format(articles) if formatting else articles
+    if cache is not None and articles:
+        await to_thread(save_cache, cache, articles)
+
+    return articles
 
 
 def convert_latex(string: str, /) -> str:
     """Convert all LaTeX commands in a string to Unicode."""
-    return ARXIV_LATEX_CONVERTER.latex_to_text(string)
+    if ARXIV_LATEX_PATTERN.search(string) is None:
+        return string
+
+    return get_converter().latex_to_text(string)
+
+
+def get_converter() -> LatexNodes2Text:
+    """Return the LaTeX-to-Unicode converter of the current thread."""
+    # the converter changes its own state during conversions
+    if (converter := getattr(ARXIV_LATEX_LOCAL, "converter", None)) is None:
+        converter = ARXIV_LATEX_LOCAL.converter = LatexNodes2Text()
+
+    return converter
+
+
+def get_cache(*query: object) -> Optional[Path]:
+    """Return the cache path for a query (None if cache is disabled)."""
+    if not (cache_dir := environ.get(ARXIV_CACHE_ENV)):
+        return None
+
+    key = blake2b(repr(query).encode()).hexdigest()
+    return Path(cache_dir).expanduser() / f"{key}{ARXIV_CACHE_SUFFIX}"
+
+
+def is_settled(date: str, /) -> bool:
+    """Check if a formatted date is old enough to cache its search."""
+    dt = datetime.strptime(date, ARXIV_DATE_FORMAT).replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - dt > ARXIV_CACHE_DELAY
+
+
+def load_cache(cache: Path, /) -> Optional[list[Article]]:
+    """Load articles from a cache path (None if not available)."""
+    if not cache.exists():
+        return None
+
+    try:
+        LOGGER.debug(f"Cache for search: {cache}")
+        return loads(cache.read_bytes())
+    except Exception:
+        LOGGER.warning(f"Failed to load {cache}. The cache was ignored.")
+        return None
+
+
+def save_cache(cache: Path, articles: list[Article], /) -> None:
+    """Save articles to a cache path atomically (warn if failed)."""
+    temp: Optional[Path] = None
+
+    try:
+        data = dumps(articles)
+        cache.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first not to leave a truncated cache
+        with NamedTemporaryFile(dir=cache.parent, delete=False) as file:
+            temp = Path(file.name)
+            file.write(data)
+
+        temp.replace(cache)
+    except Exception:
+        LOGGER.warning(f"Failed to save {cache}. The cache was not created.")
+
+        if temp is not None:
+            temp.unlink(missing_ok=True)
 
 
 def format_date(string: str, /) -> str:
     """Format a data-like string for arXiv."""
+    if (formatted := format_isodate(string)) is not None:
+        return formatted
+
+    # lazy import as it is heavy and only needed for non-ISO strings
+    from dateparser import parse
+
     if (dt := parse(string)) is not None:
         return dt.strftime(ARXIV_DATE_FORMAT)
 
     raise ValueError(f"Failed to parse {string!r}.")
 
 
+@lru_cache(maxsize=256)
+def format_isodate(string: str, /) -> Optional[str]:
+    """Format an ISO-format string for arXiv (None if not parsable).
+
+    Only the extended form (``YYYY-MM-DD[ HH:MM[:SS]]``) is accepted
+    as ``datetime.fromisoformat`` accepts more forms on Python 3.11+.
+
+    """
+    string = string.removesuffix(ARXIV_UTC_SUFFIX).strip()
+
+    if ARXIV_ISODATE_PATTERN.fullmatch(string) is None:
+        return None
+
+    try:
+        dt = datetime.fromisoformat(string)
+    except ValueError:
+        return None
+
+    return dt.strftime(ARXIV_DATE_FORMAT)
+
+
 def format_sep(string: str, /) -> str:
     """Format all separators in a string."""
-    return ARXIV_SEP_PATTERN.sub(ARXIV_SEP_REPL, string)
+    return ARXIV_SEP_REPL.join(string.split())
@@ -1,23 +1,23 @@
 # standard library
-from asyncio import sleep as async_sleep
+from asyncio import run, sleep as async_sleep
 from dataclasses import replace
 from time import sleep
 
 
 # dependencies
-from aixiv.article import Article, TArticle, amap
+from aixiv.article import Article, TArticle, amap, amap_async, amap_iter
 
 
 # test datasets
 articles = [
-    Article("Title A", ["Author A"], "Summary A", "http://example.com/a"),
-    Article("Title B", ["Author B"], "Summary B", "http://example.com/b"),
-    Article("Title C", ["Author C"], "Summary C", "http://example.com/c"),
+    Article("Title A", ("Author A",), "Summary A", "http://example.com/a"),
+    Article("Title B", ("Author B",), "Summary B", "http://example.com/b"),
+    Article("Title C", ("Author C",), "Summary C", "http://example.com/c"),
 ]
 articles_upper = [
-    Article("TITLE A", ["Author A"], "SUMMARY A", "http://example.com/a", articles[0]),
-    Article("TITLE B", ["Author B"], "SUMMARY B", "http://example.com/b", articles[1]),
-    Article("TITLE C", ["Author C"], "SUMMARY C", "http://example.com/c", articles[2]),
+    Article("TITLE A", ("Author A",), "SUMMARY A", "http://example.com/a", articles[0]),
+    Article("TITLE B", ("Author B",), "SUMMARY B", "http://example.com/b", articles[1]),
+    Article("TITLE C", ("Author C",), "SUMMARY C", "http://example.com/c", articles[2]),
 ]
 
 
@@ -51,3 +51,14 @@ def test_amap_async() -> None:
 
 def test_amap_async_timeout() -> None:
     assert amap(async_upper, articles, timeout=0.1) == articles
+
+
+def test_amap_async_await() -> None:
+    assert run(amap_async(async_upper, articles, timeout=10.0)) == articles_upper
+
+
+def test_amap_iter() -> None:
+    async def main() -> list[Article]:
+        return [article async for article in amap_iter(async_upper, articles)]
+
+    assert sorted(run(main()), key=lambda article: article.url) == articles_upper
@@ -1,5 +1,27 @@
+# standard library
+from asyncio import run
+from collections.abc import Iterator
+from pathlib import Path
+from pickle import dumps
+
+
 # dependencies
-from aixiv.search import search
+from arxiv import Client, Result, Search
+from pytest import MonkeyPatch, mark, raises
+from aixiv.article import Article
+from aixiv import defaults
+from aixiv.defaults import MAXIMUM, ORDER, SORT
+from aixiv.search import (
+    convert_latex,
+    format_date,
+    format_isodate,
+    format_sep,
+    get_cache,
+    is_settled,
+    search,
+    search_async,
+)
+from pylatexenc.latex2text import LatexNodes2Text
 
 
 # constants
@@ -13,6 +35,40 @@ EXPECTED_URLS = [
     "http://arxiv.org/abs/2101.00253v3",
     "http://arxiv.org/abs/2101.00283v1",
 ]
+QUERY = "submittedDate:[20210101000000 TO 20210102000000]"
+RECENT_QUERY = (
+    f"submittedDate:[{format_date(defaults.START)} TO {format_date(defaults.END)}]"
+)
+
+
+# test datasets
+articles = [
+    Article("Title A", ("Author A",), "Summary A", "http://example.com/a"),
+    Article("Title B", ("Author B",), "Summary B", "http://example.com/b"),
+]
+
+
+class FakeClient(Client):
+    def __init__(self) -> None:
+        super().__init__()
+        self.searches: list[Search] = []
+
+    def results(self, search: Search, offset: int = 0) -> Iterator[Result]:
+        self.searches.append(search)
+
+        for article in articles:
+            yield Result(
+                entry_id=article.url,
+                title=article.title,
+                authors=[Result.Author(name) for name in article.authors],
+                summary=article.summary,
+            )
+
+
+class EmptyClient(FakeClient):
+    def results(self, search: Search, offset: int = 0) -> Iterator[Result]:
+        self.searches.append(search)
+        yield from ()
 
 
 # test functions
@@ -20,3 +76,121 @@ def test_search() -> None:
     articles = search(CATEGORIES, KEYWORDS, START, END)
     urls = [article.url for article in articles]
     assert urls == EXPECTED_URLS
+
+
+def test_search_async() -> None:
+    articles = run(search_async(CATEGORIES, KEYWORDS, START, END))
+    urls = [article.url for article in articles]
+    assert urls == EXPECTED_URLS
+
+
+@mark.parametrize(
+    "string, expected",
+    [
+        ("2021-01-01", "20210101000000"),
+        ("2021-01-01 in UTC", "20210101000000"),
+        ("2021-01-01 12:34 in UTC", "20210101123400"),
+        ("2021-01-01T12:34:56", "20210101123456"),
+        ("January 1, 2021", "20210101000000"),
+    ],
+)
+def test_format_date(string: str, expected: str) -> None:
+    assert format_date(string) == expected
+
+
+def test_format_date_invalid() -> None:
+    with raises(ValueError):
+        format_date("not a date")
+
+
+@mark.parametrize("string", ["20210101", "2021-01-01T00:00+09:00", "1 day ago"])
+def test_format_isodate_fallback(string: str) -> None:
+    assert format_isodate(string) is None
+
+
+@mark.parametrize("string", ["Plain title", "It's a galaxy (z = 6)"])
+def test_convert_latex_plain(string: str) -> None:
+    assert convert_latex(string) == string
+
+
+@mark.parametrize(
+    "string",
+    [
+        r"The $\alpha$ and $\sim 21$ problem",
+        r"\textbf{bold} -- ``quoted''",
+        "A 50% increase",
+        "Spin~1 {braces}",
+    ],
+)
+def test_convert_latex(string: str) -> None:
+    assert convert_latex(string) == LatexNodes2Text().latex_to_text(string)
+
+
+def test_format_sep() -> None:
+    assert format_sep("  Title\n  of\tthe \n\n article  ") == "Title of the article"
+
+
+def test_get_cache(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("AIXIV_CACHE_DIR", raising=False)
+    assert get_cache(QUERY) is None
+
+    monkeypatch.setenv("AIXIV_CACHE_DIR", str(tmp_path))
+    assert (cache := get_cache(QUERY)) is not None
+    assert cache.parent == tmp_path
+    assert cache == get_cache(QUERY)
+    assert cache != get_cache(QUERY, False)
+
+
+def test_search_cache_hit(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AIXIV_CACHE_DIR", str(tmp_path))
+    cache = get_cache(QUERY, False, MAXIMUM, ORDER, SORT)
+    assert cache is not None
+    cache.write_bytes(dumps(articles[:1]))
+
+    client = FakeClient()
+    found = run(search_async(start=START, end=END, formatting=False, client=client))
+    assert found == articles[:1]
+    assert not client.searches
+
+
+def test_search_cache_save(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AIXIV_CACHE_DIR", str(tmp_path))
+    client = FakeClient()
+    found = search(start=START, end=END, formatting=False, client=client)
+    assert search(start=START, end=END, formatting=False, client=client) == found
+    assert len(client.searches) == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_search_cache_unwritable(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    (file := tmp_path / "file").touch()
+    monkeypatch.setenv("AIXIV_CACHE_DIR", str(file / "cache"))
+    found = search(start=START, end=END, formatting=False, client=FakeClient())
+    assert [article.url for article in found] == [a.url for a in articles]
+
+
+def test_is_settled() -> None:
+    assert is_settled(format_date(START))
+    assert not is_settled(format_date(defaults.END))
+
+
+def test_search_cache_recent(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AIXIV_CACHE_DIR", str(tmp_path))
+    assert (cache := get_cache(RECENT_QUERY, False, MAXIMUM, ORDER, SORT))
+    cache.write_bytes(dumps(articles[:1]))
+
+    client = FakeClient()
+    found = search(formatting=False, client=client)
+    assert [article.url for article in found] == [a.url for a in articles]
+    assert len(client.searches) == 1
+    assert list(tmp_path.iterdir()) == [cache]
+    assert cache.read_bytes() == dumps(articles[:1])
+
+
+def test_search_cache_empty(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("AIXIV_CACHE_DIR", str(tmp_path))
+    client = EmptyClient()
+    assert search(start=START, end=END, client=client) == []
+    assert search(start=START, end=END, client=client) == []
+    assert len(client.searches) == 2
+    assert not list(tmp_path.iterdir())
@@ -6,14 +6,14 @@ from aixiv.translate import Translator, translate
 
 # test datasets
 articles = [
-    Article("Title A", ["Author A"], "Summary A", "http://example.com/a"),
-    Article("Title B", ["Author B"], "Summary B", "http://example.com/b"),
-    Article("Title C", ["Author C"], "Summary C", "http://example.com/c"),
+    Article("Title A", ("Author A",), "Summary A", "http://example.com/a"),
+    Article("Title B", ("Author B",), "Summary B", "http://example.com/b"),
+    Article("Title C", ("Author C",), "Summary C", "http://example.com/c"),
 ]
 articles_upper = [
-    Article("TITLE A", ["Author A"], "SUMMARY A", "http://example.com/a", articles[0]),
-    Article("TITLE B", ["Author B"], "SUMMARY B", "http://example.com/b", articles[1]),
-    Article("TITLE C", ["Author C"], "SUMMARY C", "http://example.com/c", articles[2]),
+    Article("TITLE A", ("Author A",), "SUMMARY A", "http://example.com/a", articles[0]),
+    Article("TITLE B", ("Author B",), "SUMMARY B", "http://example.com/b", articles[1]),
+    Article("TITLE C", ("Author C",), "SUMMARY C", "http://example.com/c", articles[2]),
 ]
 
 